@@ -1,9 +1,10 @@
-from agent import agent, bodyguard, medium, possessed, seer, villager, werewolf  # noqa: D104
+from agent import agent, bodyguard, medium, parser, possessed, seer, villager, werewolf  # noqa: D104
 
 __all__ = [
     "agent",
     "bodyguard",
     "medium",
+    "parser",
     "possessed",
     "seer",
     "villager",
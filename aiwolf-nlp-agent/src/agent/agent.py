@@ -5,12 +5,15 @@
 
 from __future__ import annotations
 
+import functools
 import random
+import sys
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, ParamSpec, TypeVar
 
 from aiwolf_nlp_common.packet import Info, Packet, Request, Role, Setting, Status, Talk
 
+from agent.parser import parse_talks
 from utils.agent_logger import AgentLogger
 from utils.stoppable_thread import StoppableThread
 
@@ -21,12 +24,57 @@ P = ParamSpec("P")
 T = TypeVar("T")
 
 
+@functools.lru_cache(maxsize=8)
+def _load_comments(path_str: str) -> tuple[str, ...]:
+    """Load and cache the random talk comments for a file path.
+
+    ランダムトークのコメントを読み込んでパスごとにキャッシュする.
+
+    Args:
+        path_str (str): Path to the comments file / コメントファイルのパス
+
+    Returns:
+        tuple[str, ...]: Comment lines / コメント行のタプル
+    """
+    try:
+        return tuple(Path(path_str).read_text(encoding="utf-8").splitlines())
+    except FileNotFoundError:
+        return ()
+
+
 class Agent:
     """Base class for agents.
 
     エージェントの基底クラス.
     """
 
+    #__dict__を持たせず、インスタンスのメモリ削減と属性アクセスの高速化を図る
+    __slots__ = (
+        "_alive_cache",
+        "_alive_set",
+        "_black_alive",
+        "_black_alive_list",
+        "_history_dirty",
+        "_parse_cursor",
+        "_rng",
+        "_white_alive",
+        "agent_logger",
+        "agent_name",
+        "comments",
+        "config",
+        "divined_as_black",
+        "divined_as_white",
+        "divined_reports",
+        "info",
+        "request",
+        "role",
+        "seer_co_agents",
+        "setting",
+        "talk_history",
+        "vote_declarations",
+        "whisper_history",
+    )
+
     def __init__(
         self,
         config: dict[str, Any],
@@ -54,14 +102,29 @@ class Agent:
         self.whisper_history: list[Talk] = []
         self.role = role
         #占い師をCOした人のリスト
-        
-
-        self.comments: list[str] = []
-        with Path.open(
-            Path(str(self.config["path"]["random_talk"])),
-            encoding="utf-8",
-        ) as f:
-            self.comments = f.read().splitlines()
+        self.seer_co_agents: set[str] = set()
+        #他エージェントの占い報告 (発言者, 対象, 判定) のリスト
+        self.divined_reports: list[tuple[str, str, str]] = []
+        #占い報告で黒/白と判定されたエージェントの集合
+        self.divined_as_black: set[str] = set()
+        self.divined_as_white: set[str] = set()
+        #黒/白判定のうち、まだ生存しているエージェントだけに絞った集合 (イベント発生側で維持)
+        #黒はrandom.choiceで直接インデックスできるよう、同期したリスト表現も持つ
+        self._black_alive: set[str] = set()
+        self._black_alive_list: list[str] = []
+        self._white_alive: set[str] = set()
+        #投票宣言 (発言者 → 対象) の辞書
+        self.vote_declarations: dict[str, str] = {}
+        #解析済みのトーク履歴の位置と、新着トークの有無を示すダーティフラグ
+        self._parse_cursor: int = 0
+        self._history_dirty: bool = True
+        #グローバル乱数器のロックを避けるためのインスタンス専用乱数器
+        self._rng = random.Random()  # noqa: S311
+        #生存エージェントのキャッシュ (infoが更新されるまで有効)
+        self._alive_cache: tuple[str, ...] | None = None
+        self._alive_set: frozenset[str] = frozenset()
+
+        self.comments: tuple[str, ...] = _load_comments(str(self.config["path"]["random_talk"]))
 
     @staticmethod
     def timeout(func: Callable[P, T]) -> Callable[P, T]:
@@ -124,28 +187,73 @@ class Agent:
         self.request = packet.request
         if packet.info:
             self.info = packet.info
+            self._alive_cache = None
+            #死亡したエージェントを生存絞り込み済みの黒/白集合から除外する
+            if self._black_alive or self._white_alive:
+                for agent_name, status in packet.info.status_map.items():
+                    if status != Status.ALIVE:
+                        if agent_name in self._black_alive:
+                            self._black_alive.discard(agent_name)
+                            self._black_alive_list.remove(agent_name)
+                        self._white_alive.discard(agent_name)
         if packet.setting:
             self.setting = packet.setting
         if packet.talk_history:
+            #発言者名をintern済みにしておき、解析ループでの自分比較をポインタ比較にする
+            for talk in packet.talk_history:
+                talk.agent = sys.intern(talk.agent)
             self.talk_history.extend(packet.talk_history)
+            self._history_dirty = True
         if packet.whisper_history:
             self.whisper_history.extend(packet.whisper_history)
         if self.request == Request.INITIALIZE:
             self.talk_history: list[Talk] = []
             self.whisper_history: list[Talk] = []
+            self._parse_cursor = 0
         self.agent_logger.logger.debug(packet)
 
-    def get_alive_agents(self) -> list[str]:
-        """Get the list of alive agents.
+    #解析時に SEER CO / 占い報告タプルを追跡するか (役職サブクラスで特化できる)
+    _TRACK_SEER_CO: ClassVar[bool] = True
+    _TRACK_DIVINED_REPORTS: ClassVar[bool] = True
+
+    def _update_game_state(self) -> None:
+        """Parse newly arrived talks and update the tracked game state.
 
-        生存しているエージェントのリストを取得する.
+        新しく届いたトークを解析してゲーム状態を更新する.
+        """
+        if not self._history_dirty or not self.info:
+            return
+        self._history_dirty = False
+        self._parse_cursor = parse_talks(
+            self.talk_history,
+            self._parse_cursor,
+            sys.intern(self.info.agent),
+            self.seer_co_agents,
+            self.divined_reports,
+            self.divined_as_black,
+            self.divined_as_white,
+            self._black_alive,
+            self._black_alive_list,
+            self._white_alive,
+            self.vote_declarations,
+            self._TRACK_SEER_CO,
+            self._TRACK_DIVINED_REPORTS,
+        )
+
+    def get_alive_agents(self) -> tuple[str, ...]:
+        """Get the alive agents.
+
+        生存しているエージェントを取得する.
 
         Returns:
-            list[str]: List of alive agent names / 生存エージェント名のリスト
+            tuple[str, ...]: Alive agent names / 生存エージェント名のタプル
         """
         if not self.info:
-            return []
-        return [k for k, v in self.info.status_map.items() if v == Status.ALIVE]
+            return ()
+        if self._alive_cache is None:
+            self._alive_cache = tuple(k for k, v in self.info.status_map.items() if v == Status.ALIVE)
+            self._alive_set = frozenset(self._alive_cache)
+        return self._alive_cache
 
     def name(self) -> str:
         """Return response to name request.
@@ -168,6 +276,7 @@ class Agent:
 
         昼開始リクエストに対する処理を行う.
         """
+        self.vote_declarations.clear()
 
     def whisper(self) -> str:
         """Return response to whisper request.
@@ -177,7 +286,7 @@ class Agent:
         Returns:
             str: Whisper message / 囁きメッセージ
         """
-        return random.choice(self.comments)  # noqa: S311
+        return self._rng.choice(self.comments)
 
     def talk(self) -> str:
         """Return response to talk request.
@@ -187,6 +296,8 @@ class Agent:
         Returns:
             str: Talk message / 発言メッセージ
         """
+        self._update_game_state()
+
         # ★ここから追加★
         # self.info が None でないことを確認し、0日目かどうかを判定
         if self.info and self.info.day == 0:
@@ -196,7 +307,7 @@ class Agent:
         # ★ここまで追加★
 
         # 0日目以外は、これまで通りランダムな発言を返す
-        return random.choice(self.comments)  # noqa: S311
+        return self._rng.choice(self.comments)
 
     def daily_finish(self) -> None:
         """Perform processing for daily finish request.
@@ -212,7 +323,7 @@ class Agent:
         Returns:
             str: Agent name to divine / 占い対象のエージェント名
         """
-        return random.choice(self.get_alive_agents())  # noqa: S311
+        return self._rng.choice(self.get_alive_agents())
 
     def guard(self) -> str:
         """Return response to guard request.
@@ -222,7 +333,7 @@ class Agent:
         Returns:
             str: Agent name to guard / 護衛対象のエージェント名
         """
-        return random.choice(self.get_alive_agents())  # noqa: S311
+        return self._rng.choice(self.get_alive_agents())
 
     def vote(self) -> str:
         """Return response to vote request.
@@ -232,7 +343,8 @@ class Agent:
         Returns:
             str: Agent name to vote / 投票対象のエージェント名
         """
-        return random.choice(self.get_alive_agents())  # noqa: S311
+        self._update_game_state()
+        return self._rng.choice(self.get_alive_agents())
 
     def attack(self) -> str:
         """Return response to attack request.
@@ -242,7 +354,7 @@ class Agent:
         Returns:
             str: Agent name to attack / 襲撃対象のエージェント名
         """
-        return random.choice(self.get_alive_agents())  # noqa: S311
+        return self._rng.choice(self.get_alive_agents())
 
     def finish(self) -> None:
         """Perform processing for game finish request.
@@ -250,8 +362,26 @@ class Agent:
         ゲーム終了リクエストに対する処理を行う.
         """
 
+    #応答を返すリクエストのメソッド名テーブル (メソッド名経由でサブクラスのオーバーライドにも対応)
+    _REQUEST_HANDLERS: ClassVar[dict[Request, str]] = {
+        Request.NAME: "name",
+        Request.TALK: "talk",
+        Request.WHISPER: "whisper",
+        Request.VOTE: "vote",
+        Request.DIVINE: "divine",
+        Request.GUARD: "guard",
+        Request.ATTACK: "attack",
+    }
+    #応答を返さないリクエストのメソッド名テーブル
+    _REQUEST_PROCEDURES: ClassVar[dict[Request, str]] = {
+        Request.INITIALIZE: "initialize",
+        Request.DAILY_INITIALIZE: "daily_initialize",
+        Request.DAILY_FINISH: "daily_finish",
+        Request.FINISH: "finish",
+    }
+
     @timeout
-    def action(self) -> str | None:  # noqa: C901, PLR0911
+    def action(self) -> str | None:
         """Execute action according to request type.
 
         リクエストの種類に応じたアクションを実行する.
@@ -259,29 +389,10 @@ class Agent:
         Returns:
             str | None: Action result string or None / アクションの結果文字列またはNone
         """
-        match self.request:
-            case Request.NAME:
-                return self.name()
-            case Request.TALK:
-                return self.talk()
-            case Request.WHISPER:
-                return self.whisper()
-            case Request.VOTE:
-                return self.vote()
-            case Request.DIVINE:
-                return self.divine()
-            case Request.GUARD:
-                return self.guard()
-            case Request.ATTACK:
-                return self.attack()
-            case Request.INITIALIZE:
-                self.initialize()
-            case Request.DAILY_INITIALIZE:
-                self.daily_initialize()
-            case Request.DAILY_FINISH:
-                self.daily_finish()
-            case Request.FINISH:
-                self.finish()
-            case _:
-                pass
+        handler = self._REQUEST_HANDLERS.get(self.request)  # type: ignore[arg-type]
+        if handler is not None:
+            return getattr(self, handler)()
+        procedure = self._REQUEST_PROCEDURES.get(self.request)  # type: ignore[arg-type]
+        if procedure is not None:
+            getattr(self, procedure)()
         return None
@@ -18,6 +18,8 @@ class Bodyguard(Agent):
     騎士のエージェントクラス.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         config: dict[str, Any],
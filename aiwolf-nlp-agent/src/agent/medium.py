@@ -18,6 +18,8 @@ class Medium(Agent):
     霊媒師のエージェントクラス.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         config: dict[str, Any],
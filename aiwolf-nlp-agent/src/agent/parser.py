@@ -0,0 +1,83 @@
+"""Module that defines the talk-parsing core.
+
+トーク解析のコアを定義するモジュール.
+
+mypyc によるAOTコンパイルを想定した型安定な書き方にしてある
+(``uv run mypyc src/agent/parser.py`` でC拡張化できる).
+"""
+
+from aiwolf_nlp_common.packet import Talk
+
+#解析ループで毎トーク参照する判定文字列の定数 (intern済みリテラル)
+_JUDGED_WEREWOLF = "WEREWOLF"
+_JUDGED_HUMAN = "HUMAN"
+_CO_SEER = "SEER"
+
+
+def parse_talks(  # noqa: PLR0913
+    talk_history: list[Talk],
+    start: int,
+    my_agent: str,
+    seer_co_agents: set[str],
+    divined_reports: list[tuple[str, str, str]],
+    divined_as_black: set[str],
+    divined_as_white: set[str],
+    black_alive: set[str],
+    black_alive_list: list[str],
+    white_alive: set[str],
+    vote_declarations: dict[str, str],
+    track_seer_co: bool,  # noqa: FBT001
+    track_reports: bool,  # noqa: FBT001
+) -> int:
+    """Parse talks from ``start`` and update the given state containers.
+
+    ``start`` 以降のトークを解析し、渡された状態コンテナを更新する.
+
+    Args:
+        talk_history (list[Talk]): Full talk history / トーク履歴全体
+        start (int): Index to start parsing from / 解析を開始する位置
+        my_agent (str): Own (interned) agent name / 自分の(intern済み)エージェント名
+        seer_co_agents (set[str]): Agents that declared SEER / SEERをCOしたエージェントの集合
+        divined_reports (list[tuple[str, str, str]]): Divination reports / 占い報告のリスト
+        divined_as_black (set[str]): Agents reported as werewolf / 黒判定されたエージェントの集合
+        divined_as_white (set[str]): Agents reported as human / 白判定されたエージェントの集合
+        black_alive (set[str]): Black-reported agents still alive / 黒判定かつ生存中のエージェントの集合
+        black_alive_list (list[str]): Indexable twin of ``black_alive`` / ``black_alive``と同期したリスト表現
+        white_alive (set[str]): White-reported agents still alive / 白判定かつ生存中のエージェントの集合
+        vote_declarations (dict[str, str]): Vote declarations / 投票宣言の辞書
+        track_seer_co (bool): Whether to track SEER comingouts / SEER COを追跡するか
+        track_reports (bool): Whether to keep report tuples / 報告タプルを記録するか
+
+    Returns:
+        int: New parse cursor position / 解析後のカーソル位置
+    """
+    n = len(talk_history)
+    for i in range(start, n):
+        talk = talk_history[i]
+        if talk.agent is my_agent:
+            continue
+        #先頭トークンだけ O(先頭語長) で切り出し、コマンド以外は即座に捨てる
+        cmd, _, rest = talk.text.partition(" ")
+        if cmd == "VOTE":
+            target, _, _ = rest.partition(" ")
+            if target:
+                vote_declarations[talk.agent] = target
+        elif cmd == "DIVINED":
+            target, _, result = rest.partition(" ")
+            if not result:
+                continue
+            if result.startswith(_JUDGED_WEREWOLF):
+                divined_as_black.add(target)
+                if target not in black_alive:
+                    black_alive.add(target)
+                    black_alive_list.append(target)
+            elif result.startswith(_JUDGED_HUMAN):
+                divined_as_white.add(target)
+                white_alive.add(target)
+            else:
+                continue
+            if track_reports:
+                divined_reports.append((talk.agent, target, result))
+        elif track_seer_co and cmd == "COMINGOUT" and rest.endswith(_CO_SEER):
+            seer_co_agents.add(talk.agent)
+    return n
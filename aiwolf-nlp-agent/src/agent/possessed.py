@@ -18,6 +18,8 @@ class Possessed(Agent):
     狂人のエージェントクラス.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         config: dict[str, Any],
@@ -5,9 +5,8 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-import random #251106
+from collections import deque
+from typing import Any, ClassVar
 
 from aiwolf_nlp_common.packet import Role
 
@@ -15,6 +14,8 @@ from aiwolf_nlp_common.packet import Judge, Species
 
 from agent.agent import Agent
 
+#占い結果の判定で毎回 Species の属性参照をしないための定数
+_SPECIES_WEREWOLF = Species.WEREWOLF
 
 class Seer(Agent):
     """Seer agent class.
@@ -22,6 +23,16 @@ class Seer(Agent):
     占い師のエージェントクラス.
     """
 
+    __slots__ = (
+        "_divined_targets",
+        "_my_black_set",
+        "_my_white_set",
+        "_unreported_judges",
+        "has_co",
+        "my_divination_results",
+        "werewolves",
+    )
+
     def __init__(
         self,
         config: dict[str, Any],
@@ -32,8 +43,11 @@ class Seer(Agent):
         super().__init__(config, name, game_id, Role.SEER)
         self.has_co: bool = False  # すでにCO(カミングアウト)したかどうかを覚えておくフラグ251030
         self.my_divination_results: dict[int, Judge] = {} # 日付と、その日の占い結果を保存する辞書251030
-        self.werewolves: list[str] = [] # 占いによって人狼だと判明したエージェントのリスト251030
-        self.reported_days: list[int] = []# 「何日目」の占い結果を報告したかを記憶するリスト。251106
+        self.werewolves: set[str] = set() # 占いによって人狼だと判明したエージェントの集合251030
+        self._unreported_judges: deque[Judge] = deque()# まだ報告していない占い結果のFIFOキュー。251106
+        self._divined_targets: set[str] = set() # すでに占ったエージェントの集合 (O(1)の membership 用)
+        self._my_black_set: set[str] = set() # 自分の占いで黒と出たエージェントの集合
+        self._my_white_set: set[str] = set() # 自分の占いで白と出たエージェントの集合
 
     # --- daily_initializeメソッドをここに追加 ---251106
     def daily_initialize(self) -> None:
@@ -49,38 +63,37 @@ class Seer(Agent):
             
             # 自分の「記憶用の辞書」に、日付(int)をキーとして結果(Judge)を保存251106
             self.my_divination_results[day] = result_judge
-            self.agent_logger.logger.info(f"{day}日目の占い結果を記憶しました: {target} は {result}")
+            self._divined_targets.add(target)
+            self._unreported_judges.append(result_judge)
+            self.agent_logger.logger.info("%s日目の占い結果を記憶しました: %s は %s", day, target, result)
 
             # もし結果が人狼(WEREWOLF)なら、人狼リストにも追加251106
-            if result == Species.WEREWOLF:
-                if target not in self.werewolves:
-                    self.werewolves.append(target)
+            if result == _SPECIES_WEREWOLF:
+                self._my_black_set.add(target)
+                self.werewolves.add(target)
+            else:
+                self._my_white_set.add(target)
+
+    # 占い師は自分が本物なので SEER CO の追跡も報告タプルの記録も不要
+    _TRACK_SEER_CO: ClassVar[bool] = False
+    _TRACK_DIVINED_REPORTS: ClassVar[bool] = False
 
     def talk(self) -> str:
         # 1. 1日目、かつ、まだCOしていない場合251030
         if self.info.day == 1 and not self.has_co:
             self.has_co = True  # COしたことを記憶する251030
-            co_text = f"私は占い師です。"#--英語が正解？--251106
-            self.agent_logger.logger.info(f"Day 1なのでCOします: {co_text}")
+            co_text = "私は占い師です。"#--英語が正解？--251106
+            self.agent_logger.logger.info("Day 1なのでCOします: %s", co_text)
             return co_text
         
         # 2. 占い結果の報告処理251106
-        # 自分の「記憶」(my_divination_results)をすべてチェック251106
-        for day, result in self.my_divination_results.items():
-            
-            # 「その日の結果(day)」が「報告済みリスト(reported_days)」にまだ入っていないか？251106
-            if day not in self.reported_days:
-                
-                # まだ報告していない新情報なので、報告する251106
-                report_text = f"{result.target}を占って{result.result.value}と出ました。"#--英語が正解？--251106
-                self.agent_logger.logger.info(f"新しい占い結果を報告します: {report_text}")
-                
-                # 報告したので、忘れないように「報告済みリスト」に追加する251106
-                self.reported_days.append(day)
-                
-                # 発言を返して、このターンのtalk()処理を終了251106
-                return report_text
-        
+        # 未報告キューの先頭から1件取り出して報告する (報告済みなら何もしない)251106
+        if self._unreported_judges:
+            result = self._unreported_judges.popleft()
+            report_text = f"{result.target}を占って{result.result.value}と出ました。"#--英語が正解？--251106
+            self.agent_logger.logger.info("新しい占い結果を報告します: %s", report_text)
+            return report_text
+
         # 3. デフォルトの発言処理
         return super().talk()
 
@@ -88,28 +101,43 @@ class Seer(Agent):
         # 生存者リストを取得2511106
         alive_agents = self.get_alive_agents()
 
-        # すでに占ったことがあるエージェントのリストを作成2511106
-        divined_agents = [result.target for result in self.my_divination_results.values()]
-
         # 占い候補者のリストを作成2511106
         # (生きている AND 自分ではない AND まだ占っていない)2511106
+        divined_targets = self._divined_targets
         candidates = [
-            agent for agent in alive_agents 
-            if agent != self.agent_name and agent not in divined_agents
+            agent for agent in alive_agents
+            if agent != self.agent_name and agent not in divined_targets
         ]
 
         # 候補者がいれば、その中からランダムで選ぶ2511106
         if candidates:
-            target = random.choice(candidates) # type: ignore 2511106
-            self.agent_logger.logger.info(f"占い候補者 {candidates} の中から {target} を占います。")
+            target = self._rng.choice(candidates)
+            self.agent_logger.logger.info("占い候補者 %s の中から %s を占います。", candidates, target)
             return target
             
         # 候補者がいない場合（全員占ってしまった場合など）は、自分以外の生存者からランダム2511106
         fallback_candidates = [agent for agent in alive_agents if agent != self.agent_name]
         if fallback_candidates:
-            return random.choice(fallback_candidates) # type: ignore 2511106
+            return self._rng.choice(fallback_candidates)
         
         return super().divine()
 
     def vote(self) -> str:
-        return super().vote()
+        self._update_game_state()
+        self.get_alive_agents()  # _alive_set を最新化する
+        alive_set = self._alive_set
+        my_name = self.agent_name
+
+        # 黒 > 灰 > 白 の優先順。絞り込みはすべてC実装のset演算で行う
+        blacks = self._my_black_set | self.divined_as_black
+        candidates = (blacks & alive_set) - {my_name}
+        if not candidates:
+            candidates = alive_set - self._my_white_set - blacks - {my_name}
+        if not candidates:
+            candidates = alive_set - {my_name}
+        if not candidates:
+            return super().vote()
+
+        target = self._rng.choice(tuple(candidates))
+        self.agent_logger.logger.info("投票先を選びました: %s", target)
+        return target
@@ -5,12 +5,34 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from aiwolf_nlp_common.packet import Role
 
 from agent.agent import Agent
 
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Set as AbstractSet
+
+
+def _choose(rng: random.Random, candidates: AbstractSet[str]) -> str:
+    """Pick one candidate without materializing a throwaway list.
+
+    使い捨てのリストを作らずに候補から1人選ぶ.
+
+    Args:
+        rng (random.Random): Random source / 乱数器
+        candidates (AbstractSet[str]): Non-empty candidate set / 空でない候補集合
+
+    Returns:
+        str: Chosen agent name / 選ばれたエージェント名
+    """
+    # 候補が1人だけのことが多いので、その場合はtuple化もchoiceも省く
+    if len(candidates) == 1:
+        return next(iter(candidates))
+    return rng.choice(tuple(candidates))
+
 
 class Villager(Agent):
     """Villager agent class.
@@ -18,6 +40,8 @@ class Villager(Agent):
     村人のエージェントクラス.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         config: dict[str, Any],
@@ -52,7 +76,62 @@ class Villager(Agent):
 
         投票リクエストに対する応答を返す.
 
+        トーク解析で得た占い報告をもとに、黒判定 > 灰色 > それ以外 の優先順で投票先を選ぶ.
+
         Returns:
             str: Agent name to vote / 投票対象のエージェント名
         """
+        self._update_game_state()
+
+        # 以降で繰り返し使う属性をローカルへ束縛する (LOAD_ATTR → LOAD_FAST)
+        my_name = self.agent_name
+        rng = self._rng
+        log = self.agent_logger.logger.info
+        self.get_alive_agents()  # _alive_set を最新化する
+        alive_set = self._alive_set
+
+        # 終盤の定型ケースを特別扱いし、集合の組み立てを丸ごと省く
+        others = alive_set - {my_name}
+        n_others = len(others)
+        if n_others == 1:
+            target = next(iter(others))
+            log("残り1人のため %s に投票します。", target)
+            return target
+        if n_others == 2:  # noqa: PLR2004
+            blacks = self._black_alive & others
+            if blacks:
+                target = next(iter(blacks))
+                log("残り2人のうち黒判定の %s に投票します。", target)
+                return target
+
+        # 黒判定されている生存者がいれば、その中から投票する。
+        # 生存者への絞り込みはイベント発生側 (解析とパケット受信) で維持済み
+        black_alive = self._black_alive
+        if black_alive:
+            if my_name not in black_alive and black_alive <= alive_set:
+                # 集合と同期しているリスト表現を直接インデックスし、tuple化を省く
+                black_seq = self._black_alive_list
+                target = black_seq[0] if len(black_seq) == 1 else rng.choice(black_seq)
+                log("黒判定リスト %s から %s に投票します。", black_alive, target)
+                return target
+            # 同一パケット内の報告が自分や死亡者を指す場合だけ絞り込みに落ちる
+            black_list = (black_alive & alive_set).difference((my_name,))
+            if black_list:
+                target = _choose(rng, black_list)
+                log("黒判定リスト %s から %s に投票します。", black_list, target)
+                return target
+
+        # 白判定もされていない「灰色」の生存者から投票する (C実装のset差分で一括抽出)
+        gray_list = alive_set.difference(self._white_alive, (my_name,))
+        if gray_list:
+            target = _choose(rng, gray_list)
+            log("灰色リスト %s から %s に投票します。", gray_list, target)
+            return target
+
+        # 全員が白判定なら、自分以外の生存者から投票する
+        if others:
+            target = _choose(rng, others)
+            log("白判定のみのため %s から %s に投票します。", others, target)
+            return target
+
         return super().vote()
@@ -18,6 +18,8 @@ class Werewolf(Agent):
     人狼のエージェントクラス.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         config: dict[str, Any],